@@ -1,17 +1,83 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
+import sys
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Popularity metrics stored for each repository
+METRIC_COLUMNS = ["stars", "forks", "watchers"]
+
+# Larger results are written as tab-separated values unless another format is requested
+PRETTY_MAX_ROWS = 1000
+
+# Frames with at least this many rows are filtered with the Numba kernel, when available;
+# below it the kernel's threading overhead outweighs the gain
+NUMBA_MIN_ROWS = 1_000_000
+
+# Sentinels used by the Numba kernel for bounds that are not set
+NO_LOWER_BOUND = np.iinfo(np.int64).min
+NO_UPPER_BOUND = np.iinfo(np.int64).max
+
+
+@functools.lru_cache(maxsize=None)
+def get_filter_bounds_kernel():
+    """
+    Compile the Numba filter kernel on first use.
+
+    Numba is only imported here, so runs on ordinary-sized data never pay for loading it.
+
+    Returns:
+    function: The compiled kernel, or None if Numba is not installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def filter_bounds_kernel(
+        stars, forks, watchers, s_lo, s_hi, f_lo, f_hi, w_lo, w_hi, out
+    ):
+        """
+        Mark the rows whose stars, forks, and watchers all fall within the given bounds.
+
+        Args:
+        stars, forks, watchers (np.ndarray): The metric columns.
+        s_lo, s_hi, f_lo, f_hi, w_lo, w_hi (int): Inclusive bounds for each metric.
+        out (np.ndarray): uint8 array receiving 1 for rows that pass and 0 otherwise.
+        """
+        for i in prange(len(stars)):
+            out[i] = (
+                s_lo <= stars[i] <= s_hi
+                and f_lo <= forks[i] <= f_hi
+                and w_lo <= watchers[i] <= w_hi
+            )
+
+    return filter_bounds_kernel
+
 
 def load_json_data(file_path):
     """
     Load JSON data from the specified file.
 
+    Files with a .jsonl extension are read as JSON Lines, one repository per line.
+
     Args:
-    file_path (str or Path): Path to the JSON file containing the ingested data.
+    file_path (str or Path): Path to the JSON or JSON Lines file containing the ingested data.
 
     Returns:
     pd.DataFrame: DataFrame containing the ingested data.
@@ -21,13 +87,50 @@ def load_json_data(file_path):
     if not file_path.exists():
         raise FileNotFoundError(f"The file {file_path} does not exist.")
 
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    loads = orjson.loads if orjson is not None else json.loads
+
+    if file_path.suffix == ".jsonl":
+        # JSON Lines: one {"url": ..., "stars": ..., ...} record per line
+        data = {}
+        with file_path.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    record = loads(line)
+                    data[record.pop("url")] = record
+    elif orjson is not None:
+        data = orjson.loads(file_path.read_bytes())
+    else:
+        with file_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    # Build the DataFrame column by column so each metric is stored as its own typed array
+    urls = list(data.keys())
+
+    # Arrow-backed strings live in one contiguous buffer instead of one Python object per row.
+    # A categorical column would not help here: every URL is unique.
+    if pyarrow is not None:
+        columns = {"url": pd.array(urls, dtype=pd.StringDtype("pyarrow"))}
+    else:
+        columns = {"url": urls}
+
+    int32_info = np.iinfo(np.int32)
+    for column in METRIC_COLUMNS:
+        values = np.fromiter(
+            (data[url].get(column, 0) for url in urls),
+            dtype=np.int64,
+            count=len(urls),
+        )
 
-    # Convert the data to a DataFrame
-    df = pd.DataFrame.from_dict(data, orient="index")
-    df.reset_index(inplace=True)
-    df.rename(columns={"index": "url"}, inplace=True)
+        # GitHub counts fit comfortably in int32, which halves the memory the
+        # filter and sort kernels have to stream through
+        if values.size == 0 or (
+            values.min() >= int32_info.min and values.max() <= int32_info.max
+        ):
+            values = values.astype(np.int32, copy=False)
+
+        columns[column] = values
+
+    df = pd.DataFrame(columns, copy=False)
 
     return df
 
@@ -44,6 +147,9 @@ def filter_data(
     """
     Filter the DataFrame based on the specified min/max values for stars, forks, and watchers.
 
+    Large frames are filtered with a parallel Numba kernel when Numba is installed. Otherwise
+    the bounds are combined into a single numpy mask.
+
     Args:
     df (pd.DataFrame): The DataFrame to filter.
     min_stars (int): Minimum number of stars.
@@ -56,37 +162,85 @@ def filter_data(
     Returns:
     pd.DataFrame: Filtered DataFrame.
     """
-    if min_stars is not None:
-        df = df[df["stars"] >= min_stars]
-    if max_stars is not None:
-        df = df[df["stars"] <= max_stars]
+    bounds = [
+        ("stars", min_stars, max_stars),
+        ("forks", min_forks, max_forks),
+        ("watchers", min_watchers, max_watchers),
+    ]
 
-    if min_forks is not None:
-        df = df[df["forks"] >= min_forks]
-    if max_forks is not None:
-        df = df[df["forks"] <= max_forks]
+    if all(minimum is None and maximum is None for _, minimum, maximum in bounds):
+        return df
 
-    if min_watchers is not None:
-        df = df[df["watchers"] >= min_watchers]
-    if max_watchers is not None:
-        df = df[df["watchers"] <= max_watchers]
+    filter_bounds_kernel = (
+        get_filter_bounds_kernel() if len(df) >= NUMBA_MIN_ROWS else None
+    )
 
-    return df
+    if filter_bounds_kernel is not None:
+        limits = []
+        for _, minimum, maximum in bounds:
+            limits.append(NO_LOWER_BOUND if minimum is None else int(minimum))
+            limits.append(NO_UPPER_BOUND if maximum is None else int(maximum))
+
+        out = np.empty(len(df), dtype=np.uint8)
+        filter_bounds_kernel(
+            df["stars"].to_numpy(),
+            df["forks"].to_numpy(),
+            df["watchers"].to_numpy(),
+            *limits,
+            out,
+        )
+        return df.iloc[np.flatnonzero(out)]
 
+    # Combine every active bound into a single mask so the rows are only taken once
+    mask = np.ones(len(df), dtype=bool)
+    for column, minimum, maximum in bounds:
+        values = df[column].to_numpy()
+        if minimum is not None:
+            np.logical_and(mask, values >= minimum, out=mask)
+        if maximum is not None:
+            np.logical_and(mask, values <= maximum, out=mask)
 
-def sort_data(df, sort_by="stars", ascending=False):
+    return df.iloc[np.flatnonzero(mask)]
+
+
+def sort_data(df, sort_by="stars", ascending=False, top_n=None):
     """
     Sort the DataFrame by the specified column in ascending or descending order.
 
+    When only the first top_n rows are wanted, the cut-off value is found with
+    np.partition and just the rows up to it are sorted, instead of sorting the whole frame.
+
     Args:
     df (pd.DataFrame): The DataFrame to sort.
     sort_by (str): The column to sort by ('stars', 'forks', or 'watchers').
     ascending (bool): Whether to sort in ascending order.
+    top_n (int): Number of rows to keep from the start of the sorted data, or None to keep all rows.
 
     Returns:
     pd.DataFrame: Sorted DataFrame.
     """
-    return df.sort_values(by=sort_by, ascending=ascending)
+    if top_n is None or top_n >= len(df):
+        return df.sort_values(by=sort_by, ascending=ascending, kind="stable")
+
+    if top_n <= 0:
+        return df.iloc[:0]
+
+    # Sort keys in ascending order, so the wanted rows are always the smallest keys
+    keys = df[sort_by].to_numpy()
+    if not ascending:
+        keys = -keys.astype(np.int64)
+
+    # Rows strictly before the cut-off value are always kept; the remaining slots go to
+    # the earliest rows tied at the cut-off, matching the stable full sort
+    kth = np.partition(keys, top_n - 1)[top_n - 1]
+    before = np.flatnonzero(keys < kth)
+    tied = np.flatnonzero(keys == kth)[: top_n - len(before)]
+
+    indices = np.concatenate([before, tied])
+    indices.sort()
+    indices = indices[np.argsort(keys[indices], kind="stable")]
+
+    return df.iloc[indices]
 
 
 def main():
@@ -94,7 +248,9 @@ def main():
         description="Display and filter GitHub repository data."
     )
     parser.add_argument(
-        "input", type=str, help="Path to the JSON file containing the ingested data."
+        "input",
+        type=str,
+        help="Path to the JSON or JSON Lines (.jsonl) file containing the ingested data.",
     )
     parser.add_argument(
         "--sort-by",
@@ -108,6 +264,18 @@ def main():
         action="store_true",
         help="Sort in ascending order. Default is descending.",
     )
+    parser.add_argument(
+        "--top",
+        type=int,
+        help="Only display the first N repositories after sorting.",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["auto", "pretty", "tsv"],
+        default="auto",
+        help=f"Output format. 'auto' uses 'pretty' for up to {PRETTY_MAX_ROWS} rows and 'tsv' for more. Default is 'auto'.",
+    )
     parser.add_argument(
         "--min-stars", type=int, help="Minimum number of stars to filter by."
     )
@@ -144,10 +312,17 @@ def main():
     )
 
     # Apply sorting (default sort is by 'stars' in descending order)
-    df = sort_data(df, sort_by=args.sort_by, ascending=args.ascending)
+    df = sort_data(df, sort_by=args.sort_by, ascending=args.ascending, top_n=args.top)
+
+    # Display the data; large results skip to_string's per-cell formatting
+    output_format = args.format
+    if output_format == "auto":
+        output_format = "tsv" if len(df) > PRETTY_MAX_ROWS else "pretty"
 
-    # Display the data
-    print(df.to_string(index=False))
+    if output_format == "tsv":
+        df.to_csv(sys.stdout, sep="\t", index=False, lineterminator="\n")
+    else:
+        print(df.to_string(index=False))
 
 
 if __name__ == "__main__":
@@ -1,26 +1,85 @@
 #!/usr/bin/env python3
 
 import argparse
+import datetime
+import functools
+import os
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from pathlib import Path
 import json
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 import subprocess
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Prefer the C-based lxml parser, falling back to Python's built-in parser
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Shared session so connections are kept alive and reused across requests.
+# The only POST sent is the read-only GraphQL query, so it is safe to retry too.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            # Hand the last response back so callers can check its status code
+            raise_on_status=False,
+        ),
+    ),
+)
+SESSION.headers.update({"User-Agent": "awesome-analyzer"})
+
+# Where ETags from earlier runs are kept, so unchanged repositories can be skipped
+ETAG_CACHE_PATH = Path.home() / ".cache" / "awesome_analyzer" / "etags.json"
+
+# How long, in seconds, cached star counts are trusted to skip repositories below --min-stars
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Set of blacklisted GitHub path segments or owner names
+BLACKLISTED_OWNERS = frozenset(
+    [
+        "features",
+        "login",
+        "explore",
+        "marketplace",
+        "topics",
+        "collections",
+        "enterprise",
+        "solutions",
+        "sponsors",
+    ]
+)
 
-# List of blacklisted GitHub path segments or owner names
-BLACKLISTED_OWNERS = [
-    "features",
-    "login",
-    "explore",
-    "marketplace",
-    "topics",
-    "collections",
-    "enterprise",
-    "solutions",
-    "sponsors",
-]
+# Matches github.com/{owner}/{repo}, optionally followed by a query string or fragment
+GITHUB_REPO_URL_PATTERN = re.compile(
+    r"^https?://github\.com/([^/?#]+)/([^/?#]+)/?(?:[?#].*)?$"
+)
 
 
 def check_rate_limit(response):
@@ -39,86 +98,89 @@ def check_rate_limit(response):
     return False
 
 
-def is_valid_github_repo_url(url):
-    """
-    Check if the URL is a valid GitHub repository URL and not in the blacklist.
-    """
-    parsed_url = urlparse(url)
-    path_parts = parsed_url.path.strip("/").split("/")
-
-    # Check if the URL is in the form of github.com/{owner}/{repo}
-    if parsed_url.netloc == "github.com" and len(path_parts) == 2:
-        owner = path_parts[0]
-
-        # Exclude blacklisted owners
-        if owner not in BLACKLISTED_OWNERS:
-            return True
-
-    return False
-
-
-def clean_github_url(url):
+def extract_github_links(url):
     """
-    Clean the GitHub URL by stripping any hash fragments, query parameters,
-    or anything after the repository path.
+    Given a URL, this function fetches all valid GitHub repository links from the page.
 
     Args:
-    url (str): The GitHub repository URL.
+    url (str): The URL of the webpage to scrape.
 
     Returns:
-    str: The cleaned GitHub repository URL.
+    list: A list of unique, cleaned GitHub repository URLs found on the page.
     """
-    parsed_url = urlparse(url)
+    response = SESSION.get(url)
 
-    # Ensure we're only working with the repository path (e.g., https://github.com/owner/repo)
-    path_parts = parsed_url.path.strip("/").split("/")
+    if response.status_code != 200:
+        print(f"Failed to retrieve the webpage. Status code: {response.status_code}")
+        return []
+
+    # Only build the <a href> tags; the rest of the page is skipped while parsing
+    soup = BeautifulSoup(
+        response.content, HTML_PARSER, parse_only=SoupStrainer("a", href=True)
+    )
+    all_links = soup.find_all("a", href=True)
 
-    if len(path_parts) >= 2:
-        # Reconstruct the URL with only the scheme, netloc, and first two path segments
-        clean_path = "/".join(path_parts[:2])
-        return f"{parsed_url.scheme}://{parsed_url.netloc}/{clean_path}"
+    # Filter links to only include valid GitHub repository URLs,
+    # resolving relative links against the page they came from first
+    github_links = []
+    for link in all_links:
+        href = urljoin(response.url, link["href"])
 
-    return url  # Return the original URL if it doesn't match the expected format
+        # Validate and extract the owner and repository in the same regex match
+        match = GITHUB_REPO_URL_PATTERN.match(href)
+        if match and match.group(1) not in BLACKLISTED_OWNERS:
+            # GitHub owner and repository names are case-insensitive
+            owner, repo_name = match.groups()
+            github_links.append(f"https://github.com/{owner}/{repo_name}".lower())
 
+    # Remove duplicate links (badges, navigation, etc.) while preserving page order
+    return list(dict.fromkeys(github_links))
 
-def extract_github_links(url):
+
+def read_gh_config_token():
     """
-    Given a URL, this function fetches all valid GitHub repository links from the page.
+    Read the github.com token from the GitHub CLI's hosts.yml config file.
 
-    Args:
-    url (str): The URL of the webpage to scrape.
+    Recent GitHub CLI versions keep the token in the system keyring instead, in which
+    case the file has no token and None is returned.
 
     Returns:
-    list: A list of valid GitHub repository URLs found on the page.
+    str: The token, or None if it could not be read.
     """
-    response = requests.get(url)
+    if yaml is None:
+        return None
 
-    if response.status_code != 200:
-        print(f"Failed to retrieve the webpage. Status code: {response.status_code}")
-        return []
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    hosts_path = (
+        Path(config_dir) if config_dir else Path.home() / ".config" / "gh"
+    ) / "hosts.yml"
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    all_links = soup.find_all("a", href=True)
+    if not hosts_path.exists():
+        return None
 
-    # Filter links to only include valid GitHub repository URLs
-    github_links = [
-        (
-            link["href"]
-            if link["href"].startswith("http")
-            else f"https://github.com{link['href']}"
-        )
-        for link in all_links
-        if is_valid_github_repo_url(link["href"])
-    ]
+    try:
+        hosts = yaml.safe_load(hosts_path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError):
+        return None
 
-    return github_links
+    return (hosts.get("github.com") or {}).get("oauth_token")
 
 
+@functools.lru_cache(maxsize=None)
 def get_github_auth_token():
     """
-    Check if the user is authenticated with GitHub CLI and retrieve the token.
-    If not authenticated, return None.
+    Retrieve a GitHub token, checking the GITHUB_TOKEN and GH_TOKEN environment variables,
+    then the GitHub CLI config file, and finally asking the GitHub CLI itself.
+    If no token is found, return None. The result is cached for the rest of the run.
     """
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+
+    token = read_gh_config_token()
+    if token:
+        return token
+
     try:
         # Run the command to check if the user is authenticated with GitHub CLI
         result = subprocess.run(
@@ -138,136 +200,665 @@ def get_github_auth_token():
     return None
 
 
-def get_github_repo_popularity(github_urls, max_failures=5):
+def build_api_headers(token):
+    """
+    Build the headers sent with GitHub API requests.
+
+    Args:
+    token (str): The GitHub token, or None for unauthenticated requests.
+
+    Returns:
+    dict: The request headers.
+    """
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
+
+def load_etag_cache(file_path):
+    """
+    Load the ETag cache saved by an earlier run.
+
+    Args:
+    file_path (str or Path): Path to the ETag cache file.
+
+    Returns:
+    dict: A dictionary with the repository URL as the key and a {"etag": ..., "metrics": ..., "fetched_at": ...}
+        entry as the value. The ETag is None for entries that came from the GraphQL API, and fetched_at
+        is the time the metrics were last confirmed, in seconds since the epoch.
+    """
+    file_path = Path(file_path)
+
+    if not file_path.exists():
+        return {}
+
+    try:
+        with file_path.open("r", encoding="utf-8") as cache_file:
+            etag_cache = json.load(cache_file)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable ETag cache {file_path}: {e}")
+        return {}
+
+    # Drop entries written in an older format
+    return {
+        url: entry
+        for url, entry in etag_cache.items()
+        if isinstance(entry, dict) and "metrics" in entry
+    }
+
+
+def save_etag_cache(etag_cache, file_path):
+    """
+    Save the ETag cache, replacing the previous file atomically.
+
+    Args:
+    etag_cache (dict): A dictionary with the repository URL as the key and a {"etag": ..., "metrics": ..., "fetched_at": ...} entry as the value.
+    file_path (str or Path): Path to the ETag cache file.
+    """
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+
+    try:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as cache_file:
+            json.dump(etag_cache, cache_file)
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        print(f"An error occurred while saving the ETag cache: {e}")
+
+
+def parse_github_repo_url(url):
+    """
+    Split a GitHub repository URL into its owner and repository name.
+
+    Args:
+    url (str): The GitHub repository URL.
+
+    Returns:
+    tuple: The owner and repository name, or None if the URL does not have both.
+    """
+    match = GITHUB_REPO_URL_PATTERN.match(url)
+    if match:
+        return match.group(1), match.group(2)
+
+    path_parts = urlparse(url).path.strip("/").split("/")
+
+    if len(path_parts) < 2:
+        return None
+
+    return path_parts[0], path_parts[1]
+
+
+def send_with_rate_limit(method, api_url, rate_limit_lock, **kwargs):
+    """
+    Send a GitHub API request, sleeping out and retrying once if the rate limit is exhausted.
+
+    The rate limit lock is shared between all workers: it is held while one of them
+    sleeps out an exhausted rate limit, which keeps the others from sending requests
+    that would only be rejected.
+
+    Args:
+    method (str): The HTTP method to use.
+    api_url (str): The GitHub API URL.
+    rate_limit_lock (threading.Lock): Lock shared by all workers fetching metrics.
+    **kwargs: Extra arguments passed on to SESSION.request.
+
+    Returns:
+    requests.Response: The response from the GitHub API.
+    """
+    with rate_limit_lock:
+        pass  # Wait for any rate limit sleep in progress to finish
+
+    response = SESSION.request(method, api_url, **kwargs)
+
+    with rate_limit_lock:
+        rate_limited = check_rate_limit(response)
+
+    if rate_limited:
+        response = SESSION.request(method, api_url, **kwargs)  # Retry after sleeping
+
+    return response
+
+
+def search_github_repos(query, since, until, headers=None, rate_limit_lock=None):
+    """
+    Search GitHub for repositories matching a query and created within a date range.
+
+    The Search API returns at most 1000 results per query, so whenever a range matches
+    more than that, it is split in half and each half is searched on its own.
+
+    Args:
+    query (str): The GitHub search query, e.g. "language:python topic:cli".
+    since (datetime.date): First creation date to include.
+    until (datetime.date): Last creation date to include.
+    headers (dict): Headers to send with the API requests, or None to build them from the GitHub token.
+    rate_limit_lock (threading.Lock): Lock shared by all workers sending API requests, or None
+        when the search is not run alongside other requests.
+
+    Returns:
+    list: A list of unique GitHub repository URLs.
+    """
+    if headers is None:
+        headers = build_api_headers(get_github_auth_token())
+    if rate_limit_lock is None:
+        rate_limit_lock = threading.Lock()
+
+    search_api_url = "https://api.github.com/search/repositories"
+    max_results = 1000
+
+    params = {
+        "q": f"{query} created:{since.isoformat()}..{until.isoformat()}",
+        "per_page": 100,
+    }
+    response = send_with_rate_limit(
+        "GET", search_api_url, rate_limit_lock, headers=headers, params=params
+    )
+
+    if response.status_code != 200:
+        print(
+            f"Failed to search repositories created {since}..{until}. Status code: {response.status_code}"
+        )
+        return []
+
+    data = response.json()
+    total_count = data.get("total_count", 0)
+
+    if total_count > max_results:
+        if since < until:
+            # Bisect the date range so each half fits under the result cap
+            mid = since + datetime.timedelta(days=(until - since).days // 2)
+            github_links = search_github_repos(
+                query, since, mid, headers, rate_limit_lock
+            ) + search_github_repos(
+                query, mid + datetime.timedelta(days=1), until, headers, rate_limit_lock
+            )
+            return list(dict.fromkeys(github_links))
+
+        print(
+            f"{total_count} repositories were created on {since}; only the first {max_results} can be retrieved."
+        )
+
+    print(f"Found {total_count} repositories created {since}..{until}.")
+
+    github_links = []
+    while True:
+        github_links.extend(
+            f"https://github.com/{item['full_name']}".lower()
+            for item in data.get("items", [])
+        )
+
+        next_url = response.links.get("next", {}).get("url")
+        if not next_url:
+            break
+
+        response = send_with_rate_limit(
+            "GET", next_url, rate_limit_lock, headers=headers
+        )
+        if response.status_code != 200:
+            print(
+                f"Failed to retrieve the next page of search results. Status code: {response.status_code}"
+            )
+            break
+        data = response.json()
+
+    return list(dict.fromkeys(github_links))
+
+
+def fetch_repo_metrics(url, headers, rate_limit_lock, etag_cache=None):
+    """
+    Fetch the popularity metrics for a single GitHub repository URL from the REST API.
+
+    When the ETag cache has an ETag for the URL, the request is made conditional and a
+    304 Not Modified response reuses the cached metrics instead of sending the repository again.
+
+    Args:
+    url (str): The GitHub repository URL.
+    headers (dict): Headers to send with the API request.
+    rate_limit_lock (threading.Lock): Lock shared by all workers fetching metrics.
+    etag_cache (dict): ETag cache to read from and update, or None to send unconditional requests.
+
+    Returns:
+    list: A single (URL, metrics) pair, where metrics is a dictionary with stars, forks, and watchers count, or None if the request failed.
+    """
+    base_api_url = "https://api.github.com/repos"
+
+    print(f"Attempting to ingest data from: {url}")
+
+    repo = parse_github_repo_url(url)
+    if repo is None:
+        print(f"Invalid GitHub URL format: {url}")
+        return [(url, None)]
+
+    owner, repo_name = repo
+    api_url = f"{base_api_url}/{owner}/{repo_name}"
+
+    cached = etag_cache.get(url) if etag_cache is not None else None
+    if cached is not None and cached["etag"]:
+        headers = {**headers, "If-None-Match": cached["etag"]}
+
+    response = send_with_rate_limit("GET", api_url, rate_limit_lock, headers=headers)
+
+    if response.status_code == 304 and cached is not None:
+        etag_cache[url] = {**cached, "fetched_at": time.time()}
+        return [(url, cached["metrics"])]
+
+    if response.status_code != 200:
+        print(f"Failed to retrieve data for {url}. Status code: {response.status_code}")
+        return [(url, None)]
+
+    data = response.json()
+    metrics = {
+        "stars": data.get("stargazers_count", 0),
+        "forks": data.get("forks_count", 0),
+        "watchers": data.get("watchers_count", 0),
+    }
+
+    if etag_cache is not None:
+        etag_cache[url] = {
+            "etag": response.headers.get("ETag"),
+            "metrics": metrics,
+            "fetched_at": time.time(),
+        }
+
+    return [(url, metrics)]
+
+
+def build_graphql_query(repos):
+    """
+    Build a GraphQL query that looks up several repositories at once.
+
+    Each repository is queried under an alias (r0, r1, ...) matching its position in the list.
+
+    Args:
+    repos (list): List of (owner, repository name) pairs.
+
+    Returns:
+    str: The GraphQL query.
+    """
+    # The REST API's watchers_count is a legacy alias of the star count, so
+    # watchers is read from stargazerCount to keep both code paths consistent.
+    fields = " ".join(
+        f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+        "{ stargazerCount forkCount }"
+        for index, (owner, name) in enumerate(repos)
+    )
+    return f"{{ {fields} }}"
+
+
+def fetch_repo_metrics_batch(urls, headers, rate_limit_lock):
+    """
+    Fetch the popularity metrics for several GitHub repository URLs with a single GraphQL request.
+
+    The GraphQL API only accepts authenticated requests.
+
+    Args:
+    urls (list): List of GitHub repository URLs.
+    headers (dict): Headers to send with the API request, including the authorization token.
+    rate_limit_lock (threading.Lock): Lock shared by all workers fetching metrics.
+
+    Returns:
+    list: (URL, metrics) pairs, where metrics is a dictionary with stars, forks, and watchers count, or None if the repository could not be resolved.
+
+    Raises:
+    requests.HTTPError: If the GraphQL request itself fails or the query returns no data.
+    """
+    graphql_api_url = "https://api.github.com/graphql"
+
+    print(
+        f"Attempting to ingest data for {len(urls)} repositories, starting with: {urls[0]}"
+    )
+
+    results = []
+    queried_urls = []  # Maps each alias index back to its URL
+    repos = []
+
+    for url in urls:
+        repo = parse_github_repo_url(url)
+        if repo is None:
+            print(f"Invalid GitHub URL format: {url}")
+            results.append((url, None))
+        else:
+            queried_urls.append(url)
+            repos.append(repo)
+
+    if not repos:
+        return results
+
+    response = send_with_rate_limit(
+        "POST",
+        graphql_api_url,
+        rate_limit_lock,
+        headers=headers,
+        json={"query": build_graphql_query(repos)},
+    )
+
+    if response.status_code != 200:
+        # A failed request is one failure, however many repositories it covered
+        raise requests.HTTPError(
+            f"Failed to retrieve data for {len(repos)} repositories. Status code: {response.status_code}",
+            response=response,
+        )
+
+    body = response.json()
+    errors = body.get("errors") or []
+    data = body.get("data")
+
+    if data is None:
+        # The whole query failed, which is one failure like a failed request
+        messages = "; ".join(error.get("message", "") for error in errors)
+        raise requests.HTTPError(
+            f"Failed to retrieve data for {len(repos)} repositories: {messages or 'no data returned'}",
+            response=response,
+        )
+
+    # Repositories that cannot be resolved come back as null alongside an error entry
+    # whose path starts with their alias
+    error_messages = {
+        error["path"][0]: error.get("message", "")
+        for error in errors
+        if error.get("path")
+    }
+
+    for index, url in enumerate(queried_urls):
+        alias = f"r{index}"
+        repository = data.get(alias)
+
+        if repository is None:
+            message = error_messages.get(alias)
+            if message:
+                print(f"Failed to retrieve data for {url}: {message}")
+            else:
+                print(f"Failed to retrieve data for {url}.")
+            results.append((url, None))
+            continue
+
+        results.append(
+            (
+                url,
+                {
+                    "stars": repository.get("stargazerCount", 0),
+                    "forks": repository.get("forkCount", 0),
+                    "watchers": repository.get("stargazerCount", 0),
+                },
+            )
+        )
+
+    return results
+
+
+def get_github_repo_popularity(
+    github_urls,
+    max_failures=5,
+    max_workers=16,
+    batch_size=50,
+    etag_cache_path=ETAG_CACHE_PATH,
+    min_stars=None,
+    cache_max_age=CACHE_MAX_AGE,
+):
     """
     Given a list of GitHub repository URLs, this function fetches the popularity metrics (stars, forks, watchers)
-    from the GitHub API.
+    from the GitHub API. Requests are sent concurrently from a thread pool.
+
+    Authenticated runs look up repositories in batches through the GraphQL API; unauthenticated
+    runs fall back to one REST API request per repository, made conditional on the ETags
+    cached by earlier runs. Both kinds of run store the metrics they fetch in the cache.
 
     Args:
     github_urls (list): List of GitHub repository URLs.
     max_failures (int): Maximum number of consecutive failures allowed before exiting.
+    max_workers (int): Maximum number of requests in flight at the same time.
+    batch_size (int): Number of repositories looked up per GraphQL request.
+    etag_cache_path (str or Path): Path to the ETag cache file, or None to disable the cache.
+    min_stars (int): Minimum number of stars. Repositories with fewer stars are left out, and
+        repositories whose cached star count is below it are skipped without a request.
+    cache_max_age (float): Age in seconds after which a cached star count is no longer used to
+        skip a repository; older entries are requested again and refreshed.
 
     Returns:
     dict: A dictionary with the repository URL as the key and another dictionary with stars, forks, and watchers count as the value.
     """
     repo_popularity = {}
-    base_api_url = "https://api.github.com/repos"
     consecutive_failures = 0
+    exceeded_max_failures = False
 
     # Check if the user is authenticated with GitHub CLI and get the token
     token = get_github_auth_token()
 
-    headers = {}
+    headers = build_api_headers(token)
     if token:
-        headers["Authorization"] = f"token {token}"
-        print("Sending authenticated requests using the GitHub CLI token.")
+        print("Sending authenticated requests using the GitHub token.")
     else:
         print("Sending unauthenticated requests.")
 
-    for url in github_urls:
-        print(f"Attempting to ingest data from: {url}")
-
-        try:
-            parsed_url = urlparse(url)
-            path_parts = parsed_url.path.strip("/").split("/")
-
-            if len(path_parts) >= 2:
-                owner = path_parts[0]
-                repo_name = path_parts[1]
-                api_url = f"{base_api_url}/{owner}/{repo_name}"
-                response = requests.get(api_url, headers=headers)
-
-                if check_rate_limit(response):
-                    response = requests.get(
-                        api_url, headers=headers
-                    )  # Retry after sleeping
-
-                if response.status_code == 200:
-                    data = response.json()
-                    stars = data.get("stargazers_count", 0)
-                    forks = data.get("forks_count", 0)
-                    watchers = data.get("watchers_count", 0)
-
-                    repo_popularity[url] = {
-                        "stars": stars,
-                        "forks": forks,
-                        "watchers": watchers,
-                    }
+    etag_cache = load_etag_cache(etag_cache_path) if etag_cache_path else None
+
+    if min_stars is not None and etag_cache:
+        # Skip repositories recently seen below the star threshold
+        fresh_after = time.time() - cache_max_age
+        github_urls = [
+            url
+            for url in github_urls
+            if url not in etag_cache
+            or etag_cache[url].get("fetched_at", 0) < fresh_after
+            or etag_cache[url]["metrics"]["stars"] >= min_stars
+        ]
+
+    rate_limit_lock = threading.Lock()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    try:
+        if token:
+            batches = [
+                github_urls[i : i + batch_size]
+                for i in range(0, len(github_urls), batch_size)
+            ]
+            futures = {
+                executor.submit(
+                    fetch_repo_metrics_batch, batch, headers, rate_limit_lock
+                ): batch
+                for batch in batches
+            }
+        else:
+            futures = {
+                executor.submit(
+                    fetch_repo_metrics, url, headers, rate_limit_lock, etag_cache
+                ): [url]
+                for url in github_urls
+            }
+
+        # Failures are counted in completion order, which is as close to
+        # "consecutive" as concurrent requests allow.
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                # The whole request failed, which counts as a single failure
+                print(
+                    f"An error occurred while processing {futures[future][0]}: {str(e)}"
+                )
+                results = []
+                consecutive_failures += 1
+                if consecutive_failures >= max_failures:
+                    exceeded_max_failures = True
+
+            for url, metrics in results:
+                if metrics is not None:
+                    if token and etag_cache is not None:
+                        # GraphQL has no ETags; keep a REST one while its metrics match
+                        cached = etag_cache.get(url)
+                        etag = (
+                            cached["etag"]
+                            if cached is not None and cached["metrics"] == metrics
+                            else None
+                        )
+                        etag_cache[url] = {
+                            "etag": etag,
+                            "metrics": metrics,
+                            "fetched_at": time.time(),
+                        }
+
+                    if min_stars is None or metrics["stars"] >= min_stars:
+                        repo_popularity[url] = metrics
                     consecutive_failures = (
                         0  # Reset the failure count after a successful request
                     )
                 else:
-                    print(
-                        f"Failed to retrieve data for {url}. Status code: {response.status_code}"
-                    )
                     consecutive_failures += 1
-            else:
-                print(f"Invalid GitHub URL format: {url}")
-                consecutive_failures += 1
 
-            if consecutive_failures >= max_failures:
-                print(
-                    f"Exceeded the maximum number of consecutive failures ({max_failures}). Exiting."
-                )
-                break
-        except Exception as e:
-            print(f"An error occurred while processing {url}: {str(e)}")
-            consecutive_failures += 1
+                if consecutive_failures >= max_failures:
+                    exceeded_max_failures = True
 
-            if consecutive_failures >= max_failures:
+            if exceeded_max_failures:
                 print(
                     f"Exceeded the maximum number of consecutive failures ({max_failures}). Exiting."
                 )
                 break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
-    return repo_popularity
+    if etag_cache is not None:
+        save_etag_cache(etag_cache, etag_cache_path)
 
+    # Keep the output in the same order as the input URLs
+    return {url: repo_popularity[url] for url in github_urls if url in repo_popularity}
 
-def save_to_json(data, file_path):
+
+def save_to_json(data, file_path, jsonl=False):
     """
     Save a dictionary or list as a JSON file.
 
+    In JSON Lines mode, each entry of the dictionary is written as its own line holding
+    the URL and its metrics, e.g. {"url": "...", "stars": 1, "forks": 2, "watchers": 1}.
+
     Args:
-    data (dict or list): The data to be saved as JSON.
+    data (dict or list): The data to be saved as JSON. Must be a dictionary in JSON Lines mode.
     file_path (str or Path): The file path where the JSON file will be saved.
+    jsonl (bool): Whether to write JSON Lines instead of a single JSON document.
     """
     file_path = Path(file_path)
 
     try:
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open("w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, indent=4, ensure_ascii=False)
+        if jsonl:
+            # Stream one line per entry through a large write buffer
+            with file_path.open("wb", buffering=1 << 20) as json_file:
+                for url, metrics in data.items():
+                    record = {"url": url, **metrics}
+                    if orjson is not None:
+                        json_file.write(orjson.dumps(record))
+                    else:
+                        json_file.write(
+                            json.dumps(record, ensure_ascii=False).encode("utf-8")
+                        )
+                    json_file.write(b"\n")
+        elif orjson is not None:
+            file_path.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with file_path.open("w", encoding="utf-8") as json_file:
+                json.dump(data, json_file, indent=2, ensure_ascii=False)
         print(f"Data successfully saved to {file_path}")
     except Exception as e:
         print(f"An error occurred while saving to JSON: {e}")
 
 
-def generate_output_path_from_url(url):
+def generate_output_path_from_url(url, extension=".json"):
     """
     Generate a file path based on the given URL.
 
     Args:
     url (str): The URL to generate the file path from.
+    extension (str): The file extension to append to the path.
 
     Returns:
     str: The generated file path.
     """
     parsed_url = urlparse(url)
     path = Path(parsed_url.netloc) / parsed_url.path.strip("/")
-    return str(path) + ".json"
+    return str(path) + extension
+
+
+def extract_github_links_from_urls(urls, jobs=1):
+    """
+    Fetch the valid GitHub repository links from several webpages.
+
+    With more than one job, the pages are fetched and parsed in separate processes,
+    since HTML parsing is CPU-bound.
+
+    Args:
+    urls (list): The URLs of the webpages to scrape.
+    jobs (int): Maximum number of worker processes.
+
+    Returns:
+    list: A list of unique GitHub repository URLs found across all pages, in page order.
+    """
+    workers = min(jobs, len(urls))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            links_per_page = list(executor.map(extract_github_links, urls))
+    else:
+        links_per_page = [extract_github_links(url) for url in urls]
+
+    # Merge the pages, removing links that appear on more than one of them
+    return list(dict.fromkeys(link for links in links_per_page for link in links))
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Ingest data from a URL and save GitHub repo popularity metrics as JSON."
+        description="Ingest data from one or more URLs and save GitHub repo popularity metrics as JSON."
     )
     parser.add_argument(
-        "url", type=str, help="The URL of the webpage to scrape for GitHub links."
+        "urls",
+        type=str,
+        nargs="*",
+        metavar="url",
+        help="The URL of a webpage to scrape for GitHub links.",
     )
     parser.add_argument(
         "--output",
         type=str,
-        help="The file path to save the output JSON file. If not provided, the path is derived from the URL.",
+        help="The file path to save the output JSON file. If not provided, the path is derived from the URL. Required unless exactly one URL is given.",
+    )
+    parser.add_argument(
+        "--search",
+        type=str,
+        help="A GitHub search query whose matching repositories are added to the scraped links, e.g. 'topic:cli language:python'.",
+    )
+    parser.add_argument(
+        "--created-since",
+        type=datetime.date.fromisoformat,
+        default=datetime.date(2008, 1, 1),
+        help="Only search repositories created on or after this date (YYYY-MM-DD). Default is 2008-01-01.",
+    )
+    parser.add_argument(
+        "--created-until",
+        type=datetime.date.fromisoformat,
+        default=datetime.date.today(),
+        help="Only search repositories created on or before this date (YYYY-MM-DD). Default is today.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of processes used to fetch and parse the webpages. Default is 1.",
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Save the output as JSON Lines, one repository per line. Implied by an --output path ending in .jsonl; the derived output path uses a .jsonl extension.",
+    )
+    parser.add_argument(
+        "--min-stars",
+        type=int,
+        help="Only save repositories with at least this many stars. Repositories whose star count, cached within the last day, is lower are not requested at all.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not use or update the ETag cache at {ETAG_CACHE_PATH}.",
     )
     parser.add_argument(
         "--max-failures",
@@ -275,28 +866,66 @@ def main():
         default=5,
         help="The maximum number of consecutive failures allowed before exiting. Default is 5.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=16,
+        help="The maximum number of concurrent GitHub API requests. Default is 16.",
+    )
 
     args = parser.parse_args()
 
-    print(f"Extracting GitHub links from {args.url}...")
-    github_links = extract_github_links(args.url)
-    github_links = [clean_github_url(link) for link in github_links]
+    # awesome_analyzer.py picks the format from the file extension, so keep the two in step
+    if args.output and Path(args.output).suffix == ".jsonl":
+        args.jsonl = True
+    elif args.output and args.jsonl:
+        parser.error("--jsonl requires an --output path ending in .jsonl.")
+
+    if not args.urls and not args.search:
+        parser.error("at least one URL or --search is required.")
+    if len(args.urls) != 1 and not args.output:
+        parser.error("--output is required unless exactly one URL is given.")
+
+    github_links = []
+
+    if args.urls:
+        print(f"Extracting GitHub links from {', '.join(args.urls)}...")
+        github_links = extract_github_links_from_urls(args.urls, jobs=args.jobs)
+
+    if args.search:
+        print(f"Searching GitHub for repositories matching {args.search!r}...")
+        github_links = list(
+            dict.fromkeys(
+                github_links
+                + search_github_repos(
+                    args.search, args.created_since, args.created_until
+                )
+            )
+        )
 
     if not github_links:
-        print("No valid GitHub repository links found on the page.")
+        print("No valid GitHub repository links found.")
         return
 
     print("Fetching popularity metrics for the GitHub repositories...")
     popularity_data = get_github_repo_popularity(
-        github_links, max_failures=args.max_failures
+        github_links,
+        max_failures=args.max_failures,
+        max_workers=args.max_workers,
+        etag_cache_path=None if args.no_cache else ETAG_CACHE_PATH,
+        min_stars=args.min_stars,
     )
 
     output_path = (
-        args.output if args.output else generate_output_path_from_url(args.url)
+        args.output
+        if args.output
+        else generate_output_path_from_url(
+            args.urls[0], extension=".jsonl" if args.jsonl else ".json"
+        )
     )
 
     print(f"Saving data to {output_path}...")
-    save_to_json(popularity_data, output_path)
+    save_to_json(popularity_data, output_path, jsonl=args.jsonl)
 
 
 if __name__ == "__main__":